@@ -3,132 +3,215 @@
 Build script to generate static JSON files for race analysis
 """
 
+import hashlib
 import json
 import os
 import shutil
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
+from sys import intern
 
 
 def parse_time(time_str):
     """Convert time string (MM:SS.S or H:MM:SS.S) to seconds"""
-    if not time_str or time_str.strip() == '':
+    if not time_str:
         return None
 
+    parts = time_str.split(':')
     try:
-        parts = time_str.split(':')
         if len(parts) == 2:
-            minutes, seconds = parts
-            return int(minutes) * 60 + float(seconds)
-        elif len(parts) == 3:
-            hours, minutes, seconds = parts
-            return int(hours) * 3600 + int(minutes) * 60 + float(seconds)
-    except:
+            return int(parts[0]) * 60 + float(parts[1])
+        if len(parts) == 3:
+            return int(parts[0]) * 3600 + int(parts[1]) * 60 + float(parts[2])
+    except ValueError:
         return None
     return None
 
 
+# Race years with a data/results-{year}.txt file, oldest first
+YEARS = ['2023', '2024', '2025']
+
+# Sexes with their own charts and Pareto fronts
+SEXES = ('M', 'F')
+
+# Chart pages copied into the build as-is
+HTML_FILES = ['race_chart_2023.html', 'race_chart_2024.html',
+              'race_chart_2025.html', 'race_chart_all_time.html']
+
+# Input hashes recorded by the last build, used to skip unchanged outputs;
+# kept outside build/, which is published as-is
+MANIFEST_PATH = '.build-manifest.json'
+
+# Fields loaded for every runner; results are stored as one list per field
+RESULT_COLUMNS = ('name', 'age', 'sex', 'division', 'div_place',
+                  'time_seconds', 'time_display', 'year')
+
+
+@lru_cache(maxsize=None)
 def load_raw_results(year):
-    """Load raw results for a specific year"""
-    results = []
+    """Load raw results for a specific year
+
+    Results are columnar: a dict mapping each field in RESULT_COLUMNS to a
+    list, where runner i is index i of every list. Each file is parsed once
+    per build and the cached columns are shared by every caller, so they
+    must be treated as read-only.
+    """
+    results = {column: [] for column in RESULT_COLUMNS}
     filename = f'data/results-{year}.txt'
 
     try:
-        with open(filename, 'r') as f:
-            lines = f.readlines()
-
-            # Skip header
-            for line in lines[1:]:
-                if not line.strip():
-                    continue
-
-                # Split by tabs
-                parts = line.strip().split('\t')
-                if len(parts) < 9:
-                    continue
-
-                try:
-                    age = int(parts[4])
-                    sex = parts[5]
-                    division = parts[6] if len(parts) > 6 else ''
-                    gun_time = parts[7]
-                    div_place = parts[2] if len(parts) > 2 else ''
-
-                    # Only process M and F with valid times
-                    if sex in ['M', 'F']:
-                        time_seconds = parse_time(gun_time)
-                        if time_seconds:
-                            results.append({
-                                'name': parts[3],
-                                'age': age,
-                                'sex': sex,
-                                'division': division,
-                                'div_place': div_place,
-                                'time_seconds': time_seconds,
-                                'time_display': gun_time,
-                                'year': year
-                            })
-                except (ValueError, IndexError):
-                    continue
+        with open(filename, 'rb') as f:
+            # Read the whole file in one call and skip the header
+            lines = f.read().splitlines()[1:]
     except FileNotFoundError:
         print(f"Warning: {filename} not found")
+        return results
+
+    names = results['name']
+    ages = results['age']
+    sexes = results['sex']
+    divisions = results['division']
+    div_places = results['div_place']
+    times = results['time_seconds']
+    time_displays = results['time_display']
+
+    # Check fields as bytes, decode only the used ones, and intern divisions
+    for line in lines:
+        # Split by tabs (blank and truncated lines fall out here)
+        parts = line.strip().split(b'\t')
+        if len(parts) < 9:
+            continue
+
+        # Only process M and F, before paying for any conversion
+        sex = parts[5]
+        if sex == b'M':
+            sex = 'M'
+        elif sex == b'F':
+            sex = 'F'
+        else:
+            continue
+
+        try:
+            age = int(parts[4])
+        except ValueError:
+            continue
+
+        gun_time = parts[7].decode()
+        time_seconds = parse_time(gun_time)
+        if time_seconds:
+            names.append(parts[3].decode())
+            ages.append(age)
+            sexes.append(sex)
+            divisions.append(intern(parts[6].decode()))
+            div_places.append(intern(parts[2].decode()))
+            times.append(time_seconds)
+            time_displays.append(gun_time)
+
+    results['year'] = [year] * len(names)
 
     return results
 
 
-def get_fastest_at_each_age(runners):
-    """For all-time analysis: keep only the fastest runner at each age"""
-    if not runners:
-        return []
+def select_rows(results, rows):
+    """Gather the given runner indices from every column"""
+    return {column: [values[i] for i in rows] for column, values in results.items()}
 
-    # Group by age and keep only the fastest at each age
-    age_groups = {}
-    for runner in runners:
-        age = runner['age']
-        if age not in age_groups or runner['time_seconds'] < age_groups[age]['time_seconds']:
-            age_groups[age] = runner
 
-    return list(age_groups.values())
+def filter_sex(results, sex):
+    """Columns for the runners of one sex"""
+    return select_rows(results, [i for i, s in enumerate(results['sex']) if s == sex])
 
 
-def compute_pareto_front(runners):
-    """Compute Pareto front for a set of runners"""
-    if not runners:
-        return []
+@lru_cache(maxsize=None)
+def load_results_by_sex(year):
+    """Load results for a specific year, partitioned into {'M': ..., 'F': ...}
 
-    # Find the peak (fastest runner)
-    fastest = min(runners, key=lambda x: x['time_seconds'])
-    peak_age = fastest['age']
+    Cached like load_raw_results, so every year is split by sex once per
+    build no matter how many builds include it; treat as read-only.
+    """
+    results = load_raw_results(year)
+    return {sex: filter_sex(results, sex) for sex in SEXES}
 
-    # Sort by age
-    sorted_runners = sorted(runners, key=lambda x: x['age'])
 
-    # Split into before and after peak
-    younger_than_peak = [r for r in sorted_runners if r['age'] < peak_age]
-    at_or_older_than_peak = [r for r in sorted_runners if r['age'] >= peak_age]
+def concat_results(results_list):
+    """Stack the columns of several results end to end"""
+    return {column: [value for results in results_list for value in results[column]]
+            for column in RESULT_COLUMNS}
 
-    pareto = []
 
-    # For younger ages: include if faster than all younger runners (times decreasing)
+def keep_new_bests(rows, times):
+    """Keep each runner that is faster than every runner before it"""
+    kept = []
     best_time_so_far = float('inf')
-    for runner in younger_than_peak:
-        if runner['time_seconds'] < best_time_so_far:
-            pareto.append(runner)
-            best_time_so_far = runner['time_seconds']
+    for i in rows:
+        if times[i] < best_time_so_far:
+            kept.append(i)
+            best_time_so_far = times[i]
+    return kept
 
-    # For peak and older ages: include if faster than all older runners (times increasing)
-    # Process from oldest to peak
-    best_time_so_far = float('inf')
-    older_pareto = []
-    for runner in reversed(at_or_older_than_peak):
-        if runner['time_seconds'] < best_time_so_far:
-            older_pareto.append(runner)
-            best_time_so_far = runner['time_seconds']
 
-    # Add older_pareto in correct order (youngest to oldest)
-    pareto.extend(reversed(older_pareto))
+def sweep_pareto_front(sorted_rows, times, split):
+    """Sweep age-sorted runner indices outward from the first runner of the peak age"""
+    # For younger ages: include if faster than all younger runners (times decreasing)
+    pareto = keep_new_bests(sorted_rows[:split], times)
+
+    # For peak and older ages: include if faster than all older runners,
+    # sweeping from oldest to peak and restoring youngest-to-oldest order
+    pareto.extend(reversed(keep_new_bests(reversed(sorted_rows[split:]), times)))
 
     return pareto
 
 
+def compute_pareto_front(ages, times):
+    """Compute Pareto front for a set of runners, as indices ordered by age"""
+    if not ages:
+        return []
+
+    # Find the peak (fastest runner)
+    peak_age = ages[times.index(min(times))]
+
+    # Sort by age once and split at the first runner of the peak age
+    sorted_rows = sorted(range(len(ages)), key=ages.__getitem__)
+    split = bisect_left(sorted_rows, peak_age, key=ages.__getitem__)
+
+    return sweep_pareto_front(sorted_rows, times, split)
+
+
+def compute_all_time_pareto_front(ages, times):
+    """For all-time analysis: Pareto front over the fastest runner at each age"""
+    if not ages:
+        return []
+
+    # Find the peak in the original row order: of the ages tied for the
+    # fastest time, the one that appears first in the input
+    fastest_time = min(times)
+    fastest_ages = {age for age, time_seconds in zip(ages, times) if time_seconds == fastest_time}
+    peak_age = next(age for age in ages if age in fastest_ages)
+
+    # One sort on (age, time, index) orders the runners by age and puts the
+    # fastest first within each age; split at the first runner of the peak age
+    by_age_and_time = sorted(zip(ages, times, range(len(ages))))
+    split = bisect_left(by_age_and_time, (peak_age,))
+
+    # The forward sweep over younger ages already skips everyone behind the
+    # fastest at each age, and on a tied time keeps the earliest row, as the
+    # per-age reduction would. Only the peak and older side, which is swept
+    # from oldest back and would meet each age's slowest runner first,
+    # needs reducing to the fastest runner per age
+    younger = [i for _, _, i in by_age_and_time[:split]]
+    older = [next(group)[2] for _, group in groupby(by_age_and_time[split:], key=itemgetter(0))]
+
+    return sweep_pareto_front(younger + older, times, split)
+
+
+def years_through(year):
+    """All years in YEARS up to and including the given one"""
+    return [hist_year for hist_year in YEARS if hist_year <= year]
+
+
 def build_year_data(year, all_time_years=None):
     """Build data for a specific year"""
     print(f"Building data for {year}...")
@@ -137,282 +220,205 @@ def build_year_data(year, all_time_years=None):
 
     # Determine which years to include for all-time Pareto (all years up to and including current)
     if all_time_years is None:
-        all_time_years = []
-        if year == '2025':
-            all_time_years = ['2023', '2024', '2025']
-        elif year == '2024':
-            all_time_years = ['2023', '2024']
-        else:  # 2023
-            all_time_years = ['2023']
-
-    # Load all data for all-time Pareto
-    all_time_male_results = []
-    all_time_female_results = []
-
-    for hist_year in all_time_years:
-        hist_results = load_raw_results(hist_year)
-        all_time_male_results.extend([r for r in hist_results if r['sex'] == 'M'])
-        all_time_female_results.extend([r for r in hist_results if r['sex'] == 'F'])
-
-    # Separate by sex
-    male_results = [r for r in results if r['sex'] == 'M']
-    female_results = [r for r in results if r['sex'] == 'F']
-
-    male_pareto = compute_pareto_front(male_results)
-    female_pareto = compute_pareto_front(female_results)
-
-    # Compute all-time Pareto fronts
-    male_all_time_pareto = []
-    female_all_time_pareto = []
-    if all_time_male_results:
-        fastest_male_by_age = get_fastest_at_each_age(all_time_male_results)
-        male_all_time_pareto = compute_pareto_front(fastest_male_by_age)
-    if all_time_female_results:
-        fastest_female_by_age = get_fastest_at_each_age(all_time_female_results)
-        female_all_time_pareto = compute_pareto_front(fastest_female_by_age)
+        all_time_years = years_through(year)
 
     # Find age group winners
     # First try using div_place if available, otherwise find first in each division
-    age_group_winners = []
-    age_group_winner_set = set()
-
-    # Check if we have div_place data
-    has_div_place = any(r.get('div_place') == '1' for r in results)
-
-    if has_div_place:
+    if '1' in results['div_place']:
         # Use div_place field (2025 format)
-        for result in results:
-            if result['div_place'] == '1' and result['division']:
-                key = (result['name'], result['age'], result['sex'])
-                age_group_winner_set.add(key)
-                age_group_winners.append({
-                    'name': result['name'],
-                    'age': result['age'],
-                    'sex': result['sex'],
-                    'division': result['division'],
-                    'time_display': result['time_display']
-                })
+        winner_rows = [i for i, (div_place, division)
+                       in enumerate(zip(results['div_place'], results['division']))
+                       if div_place == '1' and division]
     else:
         # Find first finisher in each division (2023/2024 format)
         division_winners = {}
-        for result in results:
-            if result['division']:
-                division = result['division']
-                if division not in division_winners:
-                    # First person in this division is the winner
-                    division_winners[division] = result
-                    key = (result['name'], result['age'], result['sex'])
-                    age_group_winner_set.add(key)
-                    age_group_winners.append({
-                        'name': result['name'],
-                        'age': result['age'],
-                        'sex': result['sex'],
-                        'division': result['division'],
-                        'time_display': result['time_display']
-                    })
-
-    age_group_winners.sort(key=lambda x: (x['sex'], x['division']))
-
-    # Create sets for quick lookup
-    pareto_runner_set = set()
-    for r in male_pareto:
-        pareto_runner_set.add((r['name'], r['age'], 'M'))
-    for r in female_pareto:
-        pareto_runner_set.add((r['name'], r['age'], 'F'))
-
-    # Create pareto winners list with age group winner flag
-    pareto_winners = []
-    for r in male_pareto:
-        key = (r['name'], r['age'], 'M')
-        is_age_group_winner = key in age_group_winner_set
-        pareto_winners.append({
-            'name': r['name'],
-            'age': r['age'],
-            'sex': 'M',
-            'time_display': r['time_display'],
-            'is_age_group_winner': is_age_group_winner
-        })
-    for r in female_pareto:
-        key = (r['name'], r['age'], 'F')
-        is_age_group_winner = key in age_group_winner_set
-        pareto_winners.append({
-            'name': r['name'],
-            'age': r['age'],
-            'sex': 'F',
-            'time_display': r['time_display'],
-            'is_age_group_winner': is_age_group_winner
-        })
-    pareto_winners.sort(key=lambda x: (x['sex'], x['age']))
-
-    # Update age group winners with Pareto flag
-    for winner in age_group_winners:
-        key = (winner['name'], winner['age'], winner['sex'])
-        winner['is_pareto'] = key in pareto_runner_set
+        for i, division in enumerate(results['division']):
+            if division and division not in division_winners:
+                division_winners[division] = i
+        winner_rows = list(division_winners.values())
+
+    age_group_winners = [{
+        'name': results['name'][i],
+        'age': results['age'][i],
+        'sex': results['sex'][i],
+        'division': results['division'][i],
+        'time_display': results['time_display'][i]
+    } for i in winner_rows]
+    age_group_winner_set = {(w['name'], w['age'], w['sex']) for w in age_group_winners}
+
+    age_group_winners.sort(key=itemgetter('sex', 'division'))
 
     # Helper function to interpolate Pareto front time at a given age
-    def get_pareto_time_at_age(age, pareto_front):
+    def get_pareto_time_at_age(age, pareto_ages, pareto_times):
         """Get the Pareto front time at a specific age (with interpolation)"""
-        if not pareto_front:
+        if not pareto_ages:
             return None
 
         # Find exact match
-        for p in pareto_front:
-            if p['age'] == age:
-                return p['time_seconds']
+        for p_age, p_time in zip(pareto_ages, pareto_times):
+            if p_age == age:
+                return p_time
 
         # Find surrounding ages for interpolation
-        younger = [p for p in pareto_front if p['age'] < age]
-        older = [p for p in pareto_front if p['age'] > age]
+        younger = [j for j, p_age in enumerate(pareto_ages) if p_age < age]
+        older = [j for j, p_age in enumerate(pareto_ages) if p_age > age]
 
         if not younger and not older:
             return None
         elif not younger:
             # Age is younger than all Pareto points, use youngest
-            return min(pareto_front, key=lambda x: x['age'])['time_seconds']
+            return pareto_times[min(range(len(pareto_ages)), key=pareto_ages.__getitem__)]
         elif not older:
             # Age is older than all Pareto points, use oldest
-            return max(pareto_front, key=lambda x: x['age'])['time_seconds']
+            return pareto_times[max(range(len(pareto_ages)), key=pareto_ages.__getitem__)]
         else:
             # Interpolate between closest younger and older
-            closest_younger = max(younger, key=lambda x: x['age'])
-            closest_older = min(older, key=lambda x: x['age'])
+            closest_younger = max(younger, key=pareto_ages.__getitem__)
+            closest_older = min(older, key=pareto_ages.__getitem__)
 
             # Linear interpolation
-            age_diff = closest_older['age'] - closest_younger['age']
-            time_diff = closest_older['time_seconds'] - closest_younger['time_seconds']
-            age_offset = age - closest_younger['age']
+            age_diff = pareto_ages[closest_older] - pareto_ages[closest_younger]
+            time_diff = pareto_times[closest_older] - pareto_times[closest_younger]
+            age_offset = age - pareto_ages[closest_younger]
 
-            return closest_younger['time_seconds'] + (time_diff * age_offset / age_diff)
+            return pareto_times[closest_younger] + (time_diff * age_offset / age_diff)
 
     # Helper function to calculate blocking runners
-    def count_blocking_runners(runner, all_runners_same_gender):
-        """Count how many runners need to be removed for this runner to be on Pareto front"""
-        # Find the peak (fastest runner)
-        fastest = min(all_runners_same_gender, key=lambda x: x['time_seconds'])
-        peak_age = fastest['age']
-
-        blocking_count = 0
-
-        if runner['age'] < peak_age:
-            # Younger than peak: count runners who are younger OR same age AND faster
-            for other in all_runners_same_gender:
-                if other['age'] <= runner['age'] and other['time_seconds'] < runner['time_seconds']:
-                    blocking_count += 1
-        elif runner['age'] > peak_age:
-            # Older than peak: count runners who are older OR same age AND faster
-            for other in all_runners_same_gender:
-                if other['age'] >= runner['age'] and other['time_seconds'] < runner['time_seconds']:
-                    blocking_count += 1
-        else:
-            # At peak age: check if they're the fastest
-            if runner['time_seconds'] == fastest['time_seconds']:
+    def count_blocking_runners(ages, times):
+        """Count, for every runner, how many runners need to be removed for them to be on Pareto front"""
+        if not ages:
+            return []
+
+        # Find the peak (fastest runner) once for the whole field
+        fastest_time = min(times)
+        peak_age = ages[times.index(fastest_time)]
+
+        blocking_counts = []
+        for age, time_seconds in zip(ages, times):
+            if age < peak_age:
+                # Younger than peak: count runners who are younger OR same age AND faster
+                blocking_count = sum(1 for other_age, other_time in zip(ages, times)
+                                     if other_age <= age and other_time < time_seconds)
+            elif age > peak_age:
+                # Older than peak: count runners who are older OR same age AND faster
+                blocking_count = sum(1 for other_age, other_time in zip(ages, times)
+                                     if other_age >= age and other_time < time_seconds)
+            elif time_seconds == fastest_time:
+                # At peak age and the fastest
                 blocking_count = 0
             else:
                 # Count faster runners at same age
-                blocking_count = sum(1 for other in all_runners_same_gender
-                                   if other['age'] == runner['age'] and other['time_seconds'] < runner['time_seconds'])
-
-        return blocking_count
-
-    # Prepare all data with distance to Pareto front and blocking count
-    male_data = []
-    for result in male_results:
-        pareto_time = get_pareto_time_at_age(result['age'], male_pareto)
-        distance = result['time_seconds'] - pareto_time if pareto_time else None
-        blocking = count_blocking_runners(result, male_results)
-
-        male_data.append({
-            'age': result['age'],
-            'time_seconds': result['time_seconds'],
-            'time_display': result['time_display'],
-            'name': result['name'],
+                blocking_count = sum(1 for other_age, other_time in zip(ages, times)
+                                     if other_age == age and other_time < time_seconds)
+            blocking_counts.append(blocking_count)
+
+        return blocking_counts
+
+    # The rest is computed identically for each sex, one pass per sex
+    all_data = {}
+    pareto_data = {}
+    all_time_pareto_data = {}
+    pareto_winners_by_sex = {}
+    pareto_runner_set = set()
+    all_runners_adjusted = []
+
+    for sex in SEXES:
+        sex_results = load_results_by_sex(year)[sex]
+        ages = sex_results['age']
+        times = sex_results['time_seconds']
+        names = sex_results['name']
+        time_displays = sex_results['time_display']
+
+        # Pareto front as a list of indices into the per-sex columns
+        pareto = compute_pareto_front(ages, times)
+
+        # Compute all-time Pareto front over this and the earlier years
+        all_time_results = concat_results(
+            [load_results_by_sex(hist_year)[sex] for hist_year in all_time_years])
+        all_time_pareto = compute_all_time_pareto_front(
+            all_time_results['age'], all_time_results['time_seconds'])
+
+        # Distance to Pareto front and blocking count for every runner, as columns
+        pareto_ages = [ages[i] for i in pareto]
+        pareto_times = [times[i] for i in pareto]
+        distances = []
+        for age, time_seconds in zip(ages, times):
+            pareto_time = get_pareto_time_at_age(age, pareto_ages, pareto_times)
+            distances.append(time_seconds - pareto_time if pareto_time else None)
+        blocking_counts = count_blocking_runners(ages, times)
+
+        # Prepare all data with distance to Pareto front and blocking count
+        all_data[sex] = [{
+            'age': age,
+            'time_seconds': time_seconds,
+            'time_display': time_display,
+            'name': name,
             'distance_to_pareto': distance,
             'blocking_runners': blocking
-        })
-
-    female_data = []
-    for result in female_results:
-        pareto_time = get_pareto_time_at_age(result['age'], female_pareto)
-        distance = result['time_seconds'] - pareto_time if pareto_time else None
-        blocking = count_blocking_runners(result, female_results)
-
-        female_data.append({
-            'age': result['age'],
-            'time_seconds': result['time_seconds'],
-            'time_display': result['time_display'],
-            'name': result['name'],
-            'distance_to_pareto': distance,
+        } for age, time_seconds, time_display, name, distance, blocking in zip(
+            ages, times, time_displays, names, distances, blocking_counts)]
+
+        pareto_data[sex] = [{
+            'age': ages[i],
+            'time_seconds': times[i],
+            'time_display': time_displays[i],
+            'name': names[i]
+        } for i in pareto]
+
+        # Format all-time Pareto data with year information
+        all_time_pareto_data[sex] = [{
+            'age': all_time_results['age'][i],
+            'time_seconds': all_time_results['time_seconds'][i],
+            'time_display': all_time_results['time_display'][i],
+            'name': all_time_results['name'][i],
+            'year': all_time_results['year'][i],
+            'is_current_year': all_time_results['year'][i] == year
+        } for i in all_time_pareto]
+
+        # Create Pareto-adjusted rankings (all runners by distance to Pareto),
+        # straight from the columns rather than by copying the records above
+        all_runners_adjusted.extend({
+            'name': name,
+            'age': age,
+            'sex': sex,
+            'time_display': time_display,
+            'time_seconds': time_seconds,
+            'distance_to_pareto': distance if distance is not None else 0,
             'blocking_runners': blocking
-        })
-
-    male_pareto_data = [{
-        'age': r['age'],
-        'time_seconds': r['time_seconds'],
-        'time_display': r['time_display'],
-        'name': r['name']
-    } for r in male_pareto]
-
-    female_pareto_data = [{
-        'age': r['age'],
-        'time_seconds': r['time_seconds'],
-        'time_display': r['time_display'],
-        'name': r['name']
-    } for r in female_pareto]
-
-    # Format all-time Pareto data with year information
-    male_all_time_pareto_data = [{
-        'age': r['age'],
-        'time_seconds': r['time_seconds'],
-        'time_display': r['time_display'],
-        'name': r['name'],
-        'year': r.get('year', 'Unknown'),
-        'is_current_year': r.get('year') == year
-    } for r in male_all_time_pareto]
-
-    female_all_time_pareto_data = [{
-        'age': r['age'],
-        'time_seconds': r['time_seconds'],
-        'time_display': r['time_display'],
-        'name': r['name'],
-        'year': r.get('year', 'Unknown'),
-        'is_current_year': r.get('year') == year
-    } for r in female_all_time_pareto]
-
-    # Create Pareto-adjusted rankings (all runners by distance to Pareto)
-    all_runners_adjusted = []
+        } for age, time_seconds, time_display, name, distance, blocking in zip(
+            ages, times, time_displays, names, distances, blocking_counts))
+
+        # Create pareto winners list with age group winner flag, and the
+        # set of Pareto runners for quick lookup
+        pareto_keys = [(names[i], ages[i], sex) for i in pareto]
+        pareto_runner_set.update(pareto_keys)
+        pareto_winners_by_sex[sex] = [{
+            'name': names[i],
+            'age': ages[i],
+            'sex': sex,
+            'time_display': time_displays[i],
+            'is_age_group_winner': key in age_group_winner_set
+        } for i, key in zip(pareto, pareto_keys)]
+
+    # Pareto winners in (sex, age) order: 'F' sorts before 'M' and each
+    # front is already ordered by age
+    pareto_winners = pareto_winners_by_sex['F'] + pareto_winners_by_sex['M']
 
-    for result in male_data:
-        all_runners_adjusted.append({
-            'name': result['name'],
-            'age': result['age'],
-            'sex': 'M',
-            'time_display': result['time_display'],
-            'time_seconds': result['time_seconds'],
-            'distance_to_pareto': result['distance_to_pareto'] if result['distance_to_pareto'] is not None else 0,
-            'blocking_runners': result['blocking_runners']
-        })
-
-    for result in female_data:
-        all_runners_adjusted.append({
-            'name': result['name'],
-            'age': result['age'],
-            'sex': 'F',
-            'time_display': result['time_display'],
-            'time_seconds': result['time_seconds'],
-            'distance_to_pareto': result['distance_to_pareto'] if result['distance_to_pareto'] is not None else 0,
-            'blocking_runners': result['blocking_runners']
-        })
+    # Update age group winners with Pareto flag
+    for winner in age_group_winners:
+        key = (winner['name'], winner['age'], winner['sex'])
+        winner['is_pareto'] = key in pareto_runner_set
 
     # Sort by distance to Pareto front first, then by actual time
-    all_runners_adjusted.sort(key=lambda x: (x['distance_to_pareto'], x['time_seconds']))
+    all_runners_adjusted.sort(key=itemgetter('distance_to_pareto', 'time_seconds'))
 
     return {
-        'male_all': male_data,
-        'female_all': female_data,
-        'male_pareto': male_pareto_data,
-        'female_pareto': female_pareto_data,
-        'male_all_time_pareto': male_all_time_pareto_data,
-        'female_all_time_pareto': female_all_time_pareto_data,
+        'male_all': all_data['M'],
+        'female_all': all_data['F'],
+        'male_pareto': pareto_data['M'],
+        'female_pareto': pareto_data['F'],
+        'male_all_time_pareto': all_time_pareto_data['M'],
+        'female_all_time_pareto': all_time_pareto_data['F'],
         'age_group_winners': age_group_winners,
         'pareto_winners': pareto_winners,
         'pareto_adjusted_rankings': all_runners_adjusted
@@ -423,101 +429,91 @@ def build_all_time_data():
     """Build combined all-time data"""
     print("Building all-time data...")
 
-    all_years = ['2023', '2024', '2025']
-    all_results = []
-
-    for year in all_years:
-        year_results = load_raw_results(year)
-        all_results.extend(year_results)
-
-    # Detect duplicate names and add year suffix if needed
-    name_year_counts = {}
-    for result in all_results:
-        name = result['name']
-        if name not in name_year_counts:
-            name_year_counts[name] = []
-        name_year_counts[name].append(result['year'])
-
-    # Add year to display name if person appears in multiple years
-    for result in all_results:
-        name = result['name']
-        if len(set(name_year_counts[name])) > 1:
-            result['display_name'] = f"{name} ({result['year']})"
-        else:
-            result['display_name'] = name
-
-    # Separate by sex
-    male_results = [r for r in all_results if r['sex'] == 'M']
-    female_results = [r for r in all_results if r['sex'] == 'F']
-
-    # Get fastest at each age then compute Pareto
-    fastest_male_by_age = get_fastest_at_each_age(male_results)
-    fastest_female_by_age = get_fastest_at_each_age(female_results)
-    male_pareto = compute_pareto_front(fastest_male_by_age)
-    female_pareto = compute_pareto_front(fastest_female_by_age)
-
-    # Format data
-    male_data = [{
-        'age': r['age'],
-        'time_seconds': r['time_seconds'],
-        'time_display': r['time_display'],
-        'name': r['display_name'],
-        'year': r['year']
-    } for r in male_results]
-
-    female_data = [{
-        'age': r['age'],
-        'time_seconds': r['time_seconds'],
-        'time_display': r['time_display'],
-        'name': r['display_name'],
-        'year': r['year']
-    } for r in female_results]
-
-    male_pareto_data = [{
-        'age': r['age'],
-        'time_seconds': r['time_seconds'],
-        'time_display': r['time_display'],
-        'name': r['display_name'],
-        'year': r['year']
-    } for r in male_pareto]
-
-    female_pareto_data = [{
-        'age': r['age'],
-        'time_seconds': r['time_seconds'],
-        'time_display': r['time_display'],
-        'name': r['display_name'],
-        'year': r['year']
-    } for r in female_pareto]
-
-    # Create Pareto winners list
-    pareto_winners = []
-    for r in male_pareto:
-        pareto_winners.append({
-            'name': r['display_name'],
-            'age': r['age'],
-            'sex': 'M',
-            'time_display': r['time_display'],
-            'year': r['year']
-        })
-    for r in female_pareto:
-        pareto_winners.append({
-            'name': r['display_name'],
-            'age': r['age'],
-            'sex': 'F',
-            'time_display': r['time_display'],
-            'year': r['year']
-        })
-    pareto_winners.sort(key=lambda x: (x['sex'], x['age']))
+    # Detect names that appear in more than one year, in a single pass
+    first_year_by_name = {}
+    multi_year_names = set()
+    for year in YEARS:
+        for name in load_raw_results(year)['name']:
+            if first_year_by_name.setdefault(name, year) != year:
+                multi_year_names.add(name)
+
+    all_data = {}
+    pareto_data = {}
+    pareto_winners_by_sex = {}
+
+    for sex in SEXES:
+        sex_results = concat_results([load_results_by_sex(year)[sex] for year in YEARS])
+
+        # Add year to display name if person appears in multiple years
+        display_names = [
+            f"{name} ({year})" if name in multi_year_names else name
+            for name, year in zip(sex_results['name'], sex_results['year'])
+        ]
+
+        # Compute Pareto over the fastest runner at each age
+        pareto = compute_all_time_pareto_front(sex_results['age'], sex_results['time_seconds'])
+
+        # Format data
+        all_data[sex] = [{
+            'age': age,
+            'time_seconds': time_seconds,
+            'time_display': time_display,
+            'name': display_name,
+            'year': year
+        } for age, time_seconds, time_display, display_name, year in zip(
+            sex_results['age'], sex_results['time_seconds'], sex_results['time_display'],
+            display_names, sex_results['year'])]
+
+        # The Pareto records have the same fields, so reuse them by index
+        pareto_data[sex] = [all_data[sex][i] for i in pareto]
+
+        pareto_winners_by_sex[sex] = [{
+            'name': record['name'],
+            'age': record['age'],
+            'sex': sex,
+            'time_display': record['time_display'],
+            'year': record['year']
+        } for record in pareto_data[sex]]
+
+    # Pareto winners in (sex, age) order: 'F' sorts before 'M' and each
+    # front is already ordered by age, so no sort is needed
+    pareto_winners = pareto_winners_by_sex['F'] + pareto_winners_by_sex['M']
 
     return {
-        'male_all': male_data,
-        'female_all': female_data,
-        'male_pareto': male_pareto_data,
-        'female_pareto': female_pareto_data,
+        'male_all': all_data['M'],
+        'female_all': all_data['F'],
+        'male_pareto': pareto_data['M'],
+        'female_pareto': pareto_data['F'],
         'pareto_winners': pareto_winners
     }
 
 
+def write_json(path, data):
+    """Write compact UTF-8 JSON for the static site"""
+    # Encode the whole document in one call and write it out as bytes
+    with open(path, 'wb') as f:
+        f.write(json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+
+
+@lru_cache(maxsize=None)
+def file_hash(path):
+    """BLAKE2b digest of a file's contents, or None if it does not exist"""
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+def load_manifest():
+    """Load the input hashes recorded by the previous build"""
+    try:
+        with open(MANIFEST_PATH, 'r') as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
 def main():
     """Main build function"""
     print("Starting static site build...")
@@ -526,28 +522,58 @@ def main():
     os.makedirs('build', exist_ok=True)
     os.makedirs('build/data', exist_ok=True)
 
-    # Build data for each year
-    for year in ['2023', '2024', '2025']:
-        data = build_year_data(year)
-        with open(f'build/data/{year}.json', 'w') as f:
-            json.dump(data, f)
-        print(f"  ✓ Generated data/{year}.json")
-
-    # Build all-time data
-    all_time_data = build_all_time_data()
-    with open('build/data/all-time.json', 'w') as f:
-        json.dump(all_time_data, f)
-    print(f"  ✓ Generated data/all-time.json")
-
-    # Copy HTML files
-    for filename in ['race_chart_2023.html', 'race_chart_2024.html',
-                     'race_chart_2025.html', 'race_chart_all_time.html']:
-        shutil.copy(filename, f'build/{filename}')
-        print(f"  ✓ Copied {filename}")
-
-    # Copy index
-    shutil.copy('race_chart_2025.html', 'build/index.html')
-    print(f"  ✓ Created index.html")
+    # Each output records the hashes of this script and of its inputs; when
+    # they all match the previous build and the output exists, it is skipped
+    previous_manifest = load_manifest()
+    manifest = {}
+
+    def up_to_date(output, inputs):
+        """Record the input hashes for an output and check them against the last build"""
+        manifest[output] = [file_hash(path) for path in [__file__, *inputs]]
+        return os.path.exists(output) and previous_manifest.get(output) == manifest[output]
+
+    # Copy the HTML pages on worker threads while the data is built
+    html_copies = {filename: filename for filename in HTML_FILES}
+    html_copies['index.html'] = 'race_chart_2025.html'
+    stale_copies = []
+    for target, source in html_copies.items():
+        if not up_to_date(f'build/{target}', [source]):
+            stale_copies.append((target, source))
+
+    with ThreadPoolExecutor() as executor:
+        copies = {target: executor.submit(shutil.copyfile, source, f'build/{target}')
+                  for target, source in stale_copies}
+
+        # Build data for each year
+        for year in YEARS:
+            if up_to_date(f'build/data/{year}.json',
+                          [f'data/results-{hist_year}.txt' for hist_year in years_through(year)]):
+                print(f"  - Skipped data/{year}.json (unchanged)")
+                continue
+            data = build_year_data(year)
+            write_json(f'build/data/{year}.json', data)
+            print(f"  ✓ Generated data/{year}.json")
+
+        # Build all-time data
+        if up_to_date('build/data/all-time.json', [f'data/results-{year}.txt' for year in YEARS]):
+            print(f"  - Skipped data/all-time.json (unchanged)")
+        else:
+            all_time_data = build_all_time_data()
+            write_json('build/data/all-time.json', all_time_data)
+            print(f"  ✓ Generated data/all-time.json")
+
+        for target in html_copies:
+            if target not in copies:
+                print(f"  - Skipped {target} (unchanged)")
+                continue
+            copies[target].result()
+            if target == 'index.html':
+                print(f"  ✓ Created index.html")
+            else:
+                print(f"  ✓ Copied {target}")
+
+    # Written last, so an interrupted build is redone in full next time
+    write_json(MANIFEST_PATH, manifest)
 
     print("\n✅ Build complete! Static site is in the 'build/' directory")
     print("\nTo serve locally:")
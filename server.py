@@ -3,574 +3,606 @@
 Simple Flask server for race results data
 """
 
-from flask import Flask, jsonify, send_file, request
+from flask import Flask, Response, abort, send_from_directory, request
+from bisect import bisect_left, bisect_right, insort
+from functools import lru_cache
+import hashlib
+from itertools import groupby
+from operator import itemgetter
 import json
+import os
 import re
 
 app = Flask(__name__)
 
+# Keep payload keys in the order they are built rather than sorting them,
+# and write accented names as UTF-8 instead of \u escapes
+app.json.sort_keys = False
+app.json.ensure_ascii = False
+
+# Fields loaded for every runner; results are stored as one list per field
+RESULT_COLUMNS = ('name', 'age', 'sex', 'division', 'div_place',
+                  'time_seconds', 'time_display', 'year')
+
+# Sexes with results; runners of any other sex are skipped
+SEXES = ('M', 'F')
+
+# Years with results, oldest first
+YEARS = ['2023', '2024', '2025']
+
+# Seconds browsers may reuse a /data response before revalidating its ETag
+DATA_MAX_AGE = 300
+
+# Seconds browsers may reuse a chart page before revalidating it
+PAGE_MAX_AGE = 3600
+
 
 def parse_time(time_str):
     """Convert time string (MM:SS.S or H:MM:SS.S) to seconds"""
-    if not time_str or time_str.strip() == '':
+    if not time_str:
         return None
 
+    parts = time_str.split(':')
     try:
-        parts = time_str.split(':')
         if len(parts) == 2:
-            minutes, seconds = parts
-            return int(minutes) * 60 + float(seconds)
-        elif len(parts) == 3:
-            hours, minutes, seconds = parts
-            return int(hours) * 3600 + int(minutes) * 60 + float(seconds)
-    except:
+            return int(parts[0]) * 60 + float(parts[1])
+        if len(parts) == 3:
+            return int(parts[0]) * 3600 + int(parts[1]) * 60 + float(parts[2])
+    except ValueError:
         return None
     return None
 
 
 def load_raw_results(year):
-    """Load raw results for a specific year"""
-    results = []
+    """Load raw results for a specific year
+
+    Results are partitioned by sex while parsing, {'M': ..., 'F': ...}, and
+    each partition is columnar: a dict mapping each field in RESULT_COLUMNS
+    to a list, where runner i is index i of every list. Parsed results are
+    cached, keyed on the file's modification time so an edited data file
+    is picked up on the next request. The returned columns are shared
+    between requests and must be treated as read-only.
+    """
     filename = f'data/results-{year}.txt'
+    return parse_results_file(filename, year, file_mtime(filename))
+
 
+def file_mtime(filename):
+    """Modification time of a file, or None if it does not exist"""
     try:
-        with open(filename, 'r') as f:
-            lines = f.readlines()
-
-            # Skip header
-            for line in lines[1:]:
-                if not line.strip():
-                    continue
-
-                # Split by tabs
-                parts = line.strip().split('\t')
-                if len(parts) < 9:
-                    continue
-
-                try:
-                    age = int(parts[4])
-                    sex = parts[5]
-                    division = parts[6] if len(parts) > 6 else ''
-                    gun_time = parts[7]
-                    div_place = parts[2] if len(parts) > 2 else ''
-
-                    # Only process M and F with valid times
-                    if sex in ['M', 'F']:
-                        time_seconds = parse_time(gun_time)
-                        if time_seconds:
-                            results.append({
-                                'name': parts[3],
-                                'age': age,
-                                'sex': sex,
-                                'division': division,
-                                'div_place': div_place,
-                                'time_seconds': time_seconds,
-                                'time_display': gun_time,
-                                'year': year
-                            })
-                except (ValueError, IndexError):
-                    continue
+        return os.stat(filename).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def data_version(years):
+    """Modification times of the given years' results files, for cache keys
+
+    The cached functions below take a file's mtime or this tuple as an extra
+    argument that is used only as part of the cache key, so an edited
+    results file is picked up on the next call. Each has a wrapper that
+    supplies the current value.
+    """
+    return tuple(file_mtime(f'data/results-{year}.txt') for year in years)
+
+
+def read_rows(filename):
+    """Yield the tab-separated fields of each row of a results file, after the header"""
+    try:
+        f = open(filename, 'r')
     except FileNotFoundError:
         print(f"Warning: {filename} not found")
+        return
+
+    # Stream the file line by line rather than holding all of it in memory
+    with f:
+        next(f, None)
+        for line in f:
+            yield line.strip().split('\t')
+
+
+@lru_cache(maxsize=32)
+def parse_results_file(filename, year, mtime):
+    """Parse a results file, partitioned by sex into columns"""
+    results = {sex: {column: [] for column in RESULT_COLUMNS} for sex in SEXES}
+
+    for parts in read_rows(filename):
+        # Blank and truncated lines fall out here
+        if len(parts) < 9:
+            continue
+
+        # Only process M and F, and only parse times for those rows
+        sex = parts[5]
+        columns = results.get(sex)
+        if columns is None:
+            continue
+
+        # int() both validates and converts the age
+        try:
+            age = int(parts[4])
+        except ValueError:
+            continue
+
+        gun_time = parts[7]
+        time_seconds = parse_time(gun_time)
+        if time_seconds:
+            columns['name'].append(parts[3])
+            columns['age'].append(age)
+            columns['sex'].append(sex)
+            columns['division'].append(parts[6])
+            columns['div_place'].append(parts[2])
+            columns['time_seconds'].append(time_seconds)
+            columns['time_display'].append(gun_time)
+
+    for columns in results.values():
+        columns['year'] = [year] * len(columns['name'])
 
     return results
 
 
-def load_race_data(year='2025'):
-    """Load and process race results"""
-    results = load_raw_results(year)
+def concat_results(results_list):
+    """Stack the columns of several results end to end"""
+    return {column: [value for results in results_list for value in results[column]]
+            for column in RESULT_COLUMNS}
 
-    # Determine which years to include for all-time Pareto (all years up to and including current)
-    all_time_years = []
-    if year == '2025':
-        all_time_years = ['2023', '2024', '2025']
-    elif year == '2024':
-        all_time_years = ['2023', '2024']
-    else:  # 2023
-        all_time_years = ['2023']
-
-    # Load all data for all-time Pareto
-    all_time_male_results = []
-    all_time_female_results = []
-
-    for hist_year in all_time_years:
-        hist_results = load_raw_results(hist_year)
-        all_time_male_results.extend([r for r in hist_results if r['sex'] == 'M'])
-        all_time_female_results.extend([r for r in hist_results if r['sex'] == 'F'])
-
-    # Separate by sex first
-    male_results = [r for r in results if r['sex'] == 'M']
-    female_results = [r for r in results if r['sex'] == 'F']
-
-    def get_fastest_at_each_age(runners):
-        """For all-time analysis: keep only the fastest runner at each age"""
-        if not runners:
-            return []
-
-        # Group by age and keep only the fastest at each age
-        age_groups = {}
-        for runner in runners:
-            age = runner['age']
-            if age not in age_groups or runner['time_seconds'] < age_groups[age]['time_seconds']:
-                age_groups[age] = runner
-
-        return list(age_groups.values())
-
-    def compute_pareto_front(runners):
-        """
-        Compute Pareto front: the optimal age-performance curve.
-        - From young to peak: times decrease (getting faster)
-        - Peak age: fastest time overall
-        - From peak to old: times increase (getting slower)
-        """
-        if not runners:
-            return []
-
-        # Find the fastest runner (peak performance)
-        fastest_runner = min(runners, key=lambda x: x['time_seconds'])
-        peak_age = fastest_runner['age']
-
-        # Sort by age
-        sorted_runners = sorted(runners, key=lambda x: x['age'])
-
-        # Split into before and after peak
-        younger_than_peak = [r for r in sorted_runners if r['age'] < peak_age]
-        at_or_older_than_peak = [r for r in sorted_runners if r['age'] >= peak_age]
-
-        pareto = []
-
-        # For younger ages: include if faster than all younger runners (times decreasing)
-        best_time_so_far = float('inf')
-        for runner in younger_than_peak:
-            if runner['time_seconds'] < best_time_so_far:
-                pareto.append(runner)
-                best_time_so_far = runner['time_seconds']
-
-        # For peak and older ages: include if faster than all older runners (times increasing)
-        # Process from oldest to peak
-        best_time_so_far = float('inf')
-        older_pareto = []
-        for runner in reversed(at_or_older_than_peak):
-            if runner['time_seconds'] < best_time_so_far:
-                older_pareto.append(runner)
-                best_time_so_far = runner['time_seconds']
-
-        # Add older_pareto in correct order (youngest to oldest)
-        pareto.extend(reversed(older_pareto))
-
-        return pareto
-
-    male_pareto = compute_pareto_front(male_results)
-    female_pareto = compute_pareto_front(female_results)
-
-    # Compute all-time Pareto fronts if we have historical data
-    # First, keep only the fastest runner at each age across all years
-    male_all_time_pareto = []
-    female_all_time_pareto = []
-    if all_time_male_results:
-        fastest_male_by_age = get_fastest_at_each_age(all_time_male_results)
-        male_all_time_pareto = compute_pareto_front(fastest_male_by_age)
-    if all_time_female_results:
-        fastest_female_by_age = get_fastest_at_each_age(all_time_female_results)
-        female_all_time_pareto = compute_pareto_front(fastest_female_by_age)
 
-    # Find age group winners (div_place == '1')
-    age_group_winners = []
-    age_group_winner_set = set()
-    for result in results:
-        if result['div_place'] == '1' and result['division']:
-            key = (result['name'], result['age'], result['sex'])
-            age_group_winner_set.add(key)
-            age_group_winners.append({
-                'name': result['name'],
-                'age': result['age'],
-                'sex': result['sex'],
-                'division': result['division'],
-                'time_display': result['time_display']
-            })
-
-    # Sort by division name
-    age_group_winners.sort(key=lambda x: (x['sex'], x['division']))
-
-    # Create sets for quick lookup
-    male_pareto_set = set((r['name'], r['age'], r['time_seconds']) for r in male_pareto)
-    female_pareto_set = set((r['name'], r['age'], r['time_seconds']) for r in female_pareto)
-
-    # Function to interpolate Pareto front time at a given age
-    def get_pareto_time_at_age(age, pareto_front):
-        """Get the Pareto front time at a specific age (with interpolation)"""
-        if not pareto_front:
-            return None
-
-        # Find exact match
-        for p in pareto_front:
-            if p['age'] == age:
-                return p['time_seconds']
-
-        # Find surrounding ages for interpolation
-        younger = [p for p in pareto_front if p['age'] < age]
-        older = [p for p in pareto_front if p['age'] > age]
-
-        if not younger and not older:
-            return None
-        elif not younger:
-            # Age is younger than all Pareto points, use youngest
-            return min(pareto_front, key=lambda x: x['age'])['time_seconds']
-        elif not older:
-            # Age is older than all Pareto points, use oldest
-            return max(pareto_front, key=lambda x: x['age'])['time_seconds']
-        else:
-            # Interpolate between closest younger and older
-            closest_younger = max(younger, key=lambda x: x['age'])
-            closest_older = min(older, key=lambda x: x['age'])
-
-            # Linear interpolation
-            age_diff = closest_older['age'] - closest_younger['age']
-            time_diff = closest_older['time_seconds'] - closest_younger['time_seconds']
-            age_offset = age - closest_younger['age']
-
-            return closest_younger['time_seconds'] + (time_diff * age_offset / age_diff)
-
-    # Function to calculate blocking runners
-    def count_blocking_runners(runner, all_runners_same_gender):
-        """
-        Count how many runners need to be removed for this runner to be on Pareto front.
-        For younger than peak: count runners who are younger AND faster
-        For older than peak: count runners who are older AND faster
-        """
-        # Find the peak (fastest runner)
-        fastest = min(all_runners_same_gender, key=lambda x: x['time_seconds'])
-        peak_age = fastest['age']
-
-        blocking_count = 0
-
-        if runner['age'] < peak_age:
-            # Younger than peak: count runners who are younger OR same age AND faster
-            for other in all_runners_same_gender:
-                if other['age'] <= runner['age'] and other['time_seconds'] < runner['time_seconds']:
-                    blocking_count += 1
-        elif runner['age'] > peak_age:
-            # Older than peak: count runners who are older OR same age AND faster
-            for other in all_runners_same_gender:
-                if other['age'] >= runner['age'] and other['time_seconds'] < runner['time_seconds']:
-                    blocking_count += 1
-        else:
-            # At peak age: check if they're the fastest
-            if runner['time_seconds'] == fastest['time_seconds']:
-                blocking_count = 0
-            else:
-                # Count faster runners at same age
-                blocking_count = sum(1 for other in all_runners_same_gender
-                                   if other['age'] == runner['age'] and other['time_seconds'] < runner['time_seconds'])
-
-        return blocking_count
-
-    # Prepare all data with distance to Pareto front and blocking count
-    male_data = []
-    female_data = []
-
-    for result in male_results:
-        pareto_time = get_pareto_time_at_age(result['age'], male_pareto)
-        distance = result['time_seconds'] - pareto_time if pareto_time else None
-        blocking = count_blocking_runners(result, male_results)
-
-        male_data.append({
-            'age': result['age'],
-            'time_seconds': result['time_seconds'],
-            'time_display': result['time_display'],
-            'name': result['name'],
-            'distance_to_pareto': distance,
-            'blocking_runners': blocking
-        })
+def load_all_results():
+    """Load every year's results stacked oldest first, partitioned by sex like load_raw_results
 
-    for result in female_results:
-        pareto_time = get_pareto_time_at_age(result['age'], female_pareto)
-        distance = result['time_seconds'] - pareto_time if pareto_time else None
-        blocking = count_blocking_runners(result, female_results)
+    Cached until a results file changes; the columns are shared and must be
+    treated as read-only.
+    """
+    return stack_all_results(data_version(YEARS))
+
+
+@lru_cache(maxsize=1)
+def stack_all_results(version):
+    """Stack all years' results"""
+    year_results = [load_raw_results(year) for year in YEARS]
+    return {sex: concat_results([results[sex] for results in year_results]) for sex in SEXES}
+
+
+def get_fastest_at_each_age(ages, times):
+    """For all-time analysis: keep only the fastest runner at each age (as indices)"""
+    # Group by age and keep only the fastest at each age, with one dict
+    # lookup per runner (ties keep the earliest runner)
+    age_groups = {}
+    for i, age in enumerate(ages):
+        fastest = age_groups.get(age)
+        if fastest is None or times[i] < times[fastest]:
+            age_groups[age] = i
+
+    return list(age_groups.values())
 
-        female_data.append({
-            'age': result['age'],
-            'time_seconds': result['time_seconds'],
-            'time_display': result['time_display'],
-            'name': result['name'],
-            'distance_to_pareto': distance,
-            'blocking_runners': blocking
-        })
-
-    # Convert Pareto fronts to same format
-    male_pareto_data = [{
-        'age': r['age'],
-        'time_seconds': r['time_seconds'],
-        'time_display': r['time_display'],
-        'name': r['name']
-    } for r in male_pareto]
-
-    female_pareto_data = [{
-        'age': r['age'],
-        'time_seconds': r['time_seconds'],
-        'time_display': r['time_display'],
-        'name': r['name']
-    } for r in female_pareto]
-
-    # Prepare Pareto front winners list with age group winner flag
-    pareto_winners = []
-    pareto_runner_set = set()
-
-    for r in male_pareto:
-        key = (r['name'], r['age'], 'M')
-        pareto_runner_set.add(key)
-        is_age_group_winner = key in age_group_winner_set
-        pareto_winners.append({
-            'name': r['name'],
-            'age': r['age'],
-            'sex': 'M',
-            'time_display': r['time_display'],
-            'is_age_group_winner': is_age_group_winner
-        })
-    for r in female_pareto:
-        key = (r['name'], r['age'], 'F')
-        pareto_runner_set.add(key)
-        is_age_group_winner = key in age_group_winner_set
-        pareto_winners.append({
-            'name': r['name'],
-            'age': r['age'],
-            'sex': 'F',
-            'time_display': r['time_display'],
-            'is_age_group_winner': is_age_group_winner
-        })
-
-    # Sort by sex then age
-    pareto_winners.sort(key=lambda x: (x['sex'], x['age']))
-
-    # Update age group winners with Pareto flag
-    for winner in age_group_winners:
-        key = (winner['name'], winner['age'], winner['sex'])
-        winner['is_pareto'] = key in pareto_runner_set
 
-    # Create Pareto-adjusted rankings (all runners by distance to Pareto)
-    all_runners_adjusted = []
+def keep_new_bests(rows, times):
+    """Keep each runner that is faster than every runner before it"""
+    kept = []
+    best_time_so_far = float('inf')
+    for i in rows:
+        if times[i] < best_time_so_far:
+            kept.append(i)
+            best_time_so_far = times[i]
+    return kept
+
+
+def sort_by_age(ages, times, rows=None):
+    """
+    Sort runner indices (optionally only the given rows) by age, returning
+    them with the position of the first runner of the peak age, where the
+    peak is the age of the fastest runner. The Pareto front and blocking
+    counts both sweep outward from this split, so one sort serves both.
+    """
+    if rows is None:
+        rows = range(len(ages))
+    if not rows:
+        return [], 0
+
+    # Find the fastest runner (peak performance)
+    peak_age = ages[min(rows, key=times.__getitem__)]
+
+    # Sort by age once and split at the first runner of the peak age
+    sorted_rows = sorted(rows, key=ages.__getitem__)
+    return sorted_rows, bisect_left(sorted_rows, peak_age, key=ages.__getitem__)
+
+
+def compute_pareto_front(ages, times, rows=None):
+    """Compute Pareto front for a set of runners, as indices ordered by age"""
+    sorted_rows, split = sort_by_age(ages, times, rows)
+    return sweep_pareto_front(sorted_rows, times, split)
+
+
+def sweep_pareto_front(sorted_rows, times, split):
+    """
+    Compute Pareto front: the optimal age-performance curve.
+    - From young to peak: times decrease (getting faster)
+    - Peak age: fastest time overall
+    - From peak to old: times increase (getting slower)
+
+    Takes runner indices sorted by age and split at the peak, as returned
+    by sort_by_age, and returns the indices on the front, youngest first.
+    """
+    # For younger ages: include if faster than all younger runners (times decreasing)
+    pareto = keep_new_bests(sorted_rows[:split], times)
+
+    # For peak and older ages: include if faster than all older runners,
+    # sweeping from oldest to peak and restoring youngest-to-oldest order
+    pareto.extend(reversed(keep_new_bests(reversed(sorted_rows[split:]), times)))
+
+    return pareto
+
+
+def count_faster_so_far(age_groups, times, blocking_counts):
+    """Sweep groups of same-age runners, counting for each runner the faster runners seen so far"""
+    seen_times = []
+    for group in age_groups:
+        # Runners of the same age block each other, so add the whole group first
+        for i in group:
+            insort(seen_times, times[i])
+        for i in group:
+            blocking_counts[i] = bisect_left(seen_times, times[i])
+
+
+def count_blocking_runners(ages, times, sorted_rows, peak_start):
+    """
+    Count, for every runner, how many runners need to be removed for them to be on Pareto front.
+    For younger than peak: count runners who are younger (or same age) AND faster
+    For older than peak: count runners who are older (or same age) AND faster
+    At peak age: count faster runners at the same age
+
+    Takes the whole field's runner indices sorted by age and split at the
+    peak, as returned by sort_by_age.
+    """
+    blocking_counts = [0] * len(ages)
+    if not sorted_rows:
+        return blocking_counts
+
+    # Group runners of the same age
+    peak_age = ages[sorted_rows[peak_start]]
+    peak_end = bisect_right(sorted_rows, peak_age, lo=peak_start, key=ages.__getitem__)
+    younger = [list(group) for _, group in groupby(sorted_rows[:peak_start], key=ages.__getitem__)]
+    older = [list(group) for _, group in groupby(sorted_rows[peak_end:], key=ages.__getitem__)]
+
+    # Younger runners are swept from youngest up, older runners from oldest
+    # down, and the peak age only competes with itself
+    count_faster_so_far(younger, times, blocking_counts)
+    count_faster_so_far(reversed(older), times, blocking_counts)
+    count_faster_so_far([sorted_rows[peak_start:peak_end]], times, blocking_counts)
+
+    return blocking_counts
+
+
+def get_pareto_time_at_age(age, pareto_ages, pareto_times):
+    """Get the Pareto front time at a specific age (with interpolation)
+
+    pareto_ages must be in ascending order, as compute_pareto_front returns
+    them; where the front has several runners of one age, the first is used.
+    """
+    if not pareto_ages:
+        return None
 
-    for result in male_data:
-        all_runners_adjusted.append({
-            'name': result['name'],
-            'age': result['age'],
-            'sex': 'M',
-            'time_display': result['time_display'],
-            'time_seconds': result['time_seconds'],
-            'distance_to_pareto': result['distance_to_pareto'] if result['distance_to_pareto'] is not None else 0,
-            'blocking_runners': result['blocking_runners']
-        })
+    # Find exact match, or where the age would be inserted
+    j = bisect_left(pareto_ages, age)
+    if j < len(pareto_ages) and pareto_ages[j] == age:
+        return pareto_times[j]
+
+    if j == 0:
+        # Age is younger than all Pareto points, use youngest
+        return pareto_times[0]
+    elif j == len(pareto_ages):
+        # Age is older than all Pareto points, use oldest
+        return pareto_times[bisect_left(pareto_ages, pareto_ages[-1])]
+    else:
+        # Interpolate between closest younger and older
+        closest_younger = bisect_left(pareto_ages, pareto_ages[j - 1])
+        closest_older = j
 
-    for result in female_data:
-        all_runners_adjusted.append({
+        # Linear interpolation
+        age_diff = pareto_ages[closest_older] - pareto_ages[closest_younger]
+        time_diff = pareto_times[closest_older] - pareto_times[closest_younger]
+        age_offset = age - pareto_ages[closest_younger]
+
+        return pareto_times[closest_younger] + (time_diff * age_offset / age_diff)
+
+
+def build_race_data(year):
+    """Process race results for a year"""
+    results = load_raw_results(year)
+
+    # Load all data for all-time Pareto; years are stacked oldest first, so
+    # the runners from all years up to and including current are a prefix
+    all_results = load_all_results()
+
+    # Find age group winners (div_place == '1')
+    age_group_winners = []
+    age_group_winner_keys = []
+    for sex in SEXES:
+        for name, age, division, div_place, time_display in zip(
+                results[sex]['name'], results[sex]['age'], results[sex]['division'],
+                results[sex]['div_place'], results[sex]['time_display']):
+            if div_place == '1' and division:
+                age_group_winner_keys.append((name, age, sex))
+                age_group_winners.append({
+                    'name': name,
+                    'age': age,
+                    'sex': sex,
+                    'division': division,
+                    'time_display': time_display
+                })
+    age_group_winner_set = frozenset(age_group_winner_keys)
+
+    # Process each sex through the same pipeline, collecting per-sex lists
+    # and the combined ranking list (men first, then women)
+    all_data = {}
+    pareto_data = {}
+    all_time_pareto_data = {}
+    pareto_winners_by_sex = {}
+    pareto_runner_keys = []
+    all_runners_adjusted = []
+    for sex in SEXES:
+        names = results[sex]['name']
+        ages = results[sex]['age']
+        times = results[sex]['time_seconds']
+        time_displays = results[sex]['time_display']
+
+        # Pareto front as indices into the sex's columns; the field is sorted
+        # by age once for both the Pareto front and the blocking counts
+        sorted_rows, split = sort_by_age(ages, times)
+        pareto = sweep_pareto_front(sorted_rows, times, split)
+        pareto_keys = [(names[i], ages[i], sex) for i in pareto]
+        pareto_runner_keys.extend(pareto_keys)
+
+        # Prepare all data with distance to Pareto front and blocking count
+        pareto_ages = [ages[i] for i in pareto]
+        pareto_times = [times[i] for i in pareto]
+        blocking_counts = count_blocking_runners(ages, times, sorted_rows, split)
+        pareto_at_age = [get_pareto_time_at_age(age, pareto_ages, pareto_times) for age in ages]
+        data = all_data[sex] = [{
+            'age': age,
+            'time_seconds': time_seconds,
+            'time_display': time_display,
+            'name': name,
+            'distance_to_pareto': time_seconds - pareto_time if pareto_time else None,
+            'blocking_runners': blocking
+        } for age, time_seconds, time_display, name, pareto_time, blocking in zip(
+            ages, times, time_displays, names, pareto_at_age, blocking_counts)]
+
+        # Convert Pareto front to same format
+        pareto_data[sex] = [{
+            'age': ages[i],
+            'time_seconds': times[i],
+            'time_display': time_displays[i],
+            'name': names[i]
+        } for i in pareto]
+
+        # Pareto front winners with age group winner flag
+        pareto_winners_by_sex[sex] = [{
+            'name': names[i],
+            'age': ages[i],
+            'sex': sex,
+            'time_display': time_displays[i],
+            'is_age_group_winner': key in age_group_winner_set
+        } for i, key in zip(pareto, pareto_keys)]
+
+        # Pareto-adjusted rankings (all runners by distance to Pareto)
+        all_runners_adjusted.extend({
             'name': result['name'],
             'age': result['age'],
-            'sex': 'F',
+            'sex': sex,
             'time_display': result['time_display'],
             'time_seconds': result['time_seconds'],
             'distance_to_pareto': result['distance_to_pareto'] if result['distance_to_pareto'] is not None else 0,
             'blocking_runners': result['blocking_runners']
-        })
+        } for result in data)
+
+        # All-time Pareto front: keep only the fastest runner at each age
+        # across all years up to and including current, with year
+        # information to mark new records
+        all_time_results = all_results[sex]
+        all_time_ages = all_time_results['age']
+        all_time_times = all_time_results['time_seconds']
+        all_time_years = all_time_results['year']
+        through_year = bisect_right(all_time_years, year)
+        all_time_pareto = compute_pareto_front(
+            all_time_ages, all_time_times,
+            get_fastest_at_each_age(all_time_ages[:through_year], all_time_times[:through_year]))
+        all_time_pareto_data[sex] = [{
+            'age': all_time_ages[i],
+            'time_seconds': all_time_times[i],
+            'time_display': all_time_results['time_display'][i],
+            'name': all_time_results['name'][i],
+            'year': all_time_years[i],
+            'is_current_year': all_time_years[i] == year
+        } for i in all_time_pareto]
+
+    # Flag age group winners who are on the Pareto front, then sort by division name
+    pareto_runner_set = frozenset(pareto_runner_keys)
+    for winner, key in zip(age_group_winners, age_group_winner_keys):
+        winner['is_pareto'] = key in pareto_runner_set
+    age_group_winners.sort(key=itemgetter('sex', 'division'))
+
+    # Pareto winners in (sex, age) order: 'F' sorts before 'M' and each
+    # front is already ordered by age
+    pareto_winners = pareto_winners_by_sex['F'] + pareto_winners_by_sex['M']
 
     # Sort by distance to Pareto front first, then by actual time
     # This puts all Pareto winners (#1) at top sorted by their race time
-    all_runners_adjusted.sort(key=lambda x: (x['distance_to_pareto'], x['time_seconds']))
-
-    # Format all-time Pareto data with year information and mark new records
-    male_all_time_pareto_data = [{
-        'age': r['age'],
-        'time_seconds': r['time_seconds'],
-        'time_display': r['time_display'],
-        'name': r['name'],
-        'year': r.get('year', 'Unknown'),
-        'is_current_year': r.get('year') == year
-    } for r in male_all_time_pareto]
-
-    female_all_time_pareto_data = [{
-        'age': r['age'],
-        'time_seconds': r['time_seconds'],
-        'time_display': r['time_display'],
-        'name': r['name'],
-        'year': r.get('year', 'Unknown'),
-        'is_current_year': r.get('year') == year
-    } for r in female_all_time_pareto]
+    all_runners_adjusted.sort(key=itemgetter('distance_to_pareto', 'time_seconds'))
 
     return {
-        'male_all': male_data,
-        'female_all': female_data,
-        'male_pareto': male_pareto_data,
-        'female_pareto': female_pareto_data,
-        'male_all_time_pareto': male_all_time_pareto_data,
-        'female_all_time_pareto': female_all_time_pareto_data,
+        'male_all': all_data['M'],
+        'female_all': all_data['F'],
+        'male_pareto': pareto_data['M'],
+        'female_pareto': pareto_data['F'],
+        'male_all_time_pareto': all_time_pareto_data['M'],
+        'female_all_time_pareto': all_time_pareto_data['F'],
         'age_group_winners': age_group_winners,
         'pareto_winners': pareto_winners,
         'pareto_adjusted_rankings': all_runners_adjusted
     }
 
 
+def build_all_time_data():
+    """Process all years combined"""
+    # Load all results from all years, already separated by sex
+    all_results = load_all_results()
+
+    # Detect names that appear in more than one year, in a single pass
+    first_year_by_name = {}
+    multi_year_names = set()
+    for results in all_results.values():
+        for name, year in zip(results['name'], results['year']):
+            if first_year_by_name.setdefault(name, year) != year:
+                multi_year_names.add(name)
+
+    # Add year to display name if person appears in multiple years (on
+    # copies, as the loaded columns are shared)
+    all_results = {sex: {**results, 'display_name': [
+        f"{name} ({year})" if name in multi_year_names else name
+        for name, year in zip(results['name'], results['year'])
+    ]} for sex, results in all_results.items()}
+
+    # Process each sex the same way: get fastest at each age then compute
+    # Pareto, and format data for display
+    all_data = {}
+    pareto_data = {}
+    pareto_winners_by_sex = {}
+    for sex in SEXES:
+        ages = all_results[sex]['age']
+        times = all_results[sex]['time_seconds']
+        time_displays = all_results[sex]['time_display']
+        display_names = all_results[sex]['display_name']
+        years = all_results[sex]['year']
+
+        pareto = compute_pareto_front(ages, times, get_fastest_at_each_age(ages, times))
+
+        all_data[sex] = [{
+            'age': age,
+            'time_seconds': time_seconds,
+            'time_display': time_display,
+            'name': display_name,
+            'year': year
+        } for age, time_seconds, time_display, display_name, year in zip(
+            ages, times, time_displays, display_names, years)]
+
+        pareto_data[sex] = [{
+            'age': ages[i],
+            'time_seconds': times[i],
+            'time_display': time_displays[i],
+            'name': display_names[i],
+            'year': years[i]
+        } for i in pareto]
+
+        # Pareto winners list (all runners on Pareto front)
+        pareto_winners_by_sex[sex] = [{
+            'name': display_names[i],
+            'age': ages[i],
+            'sex': sex,
+            'time_display': time_displays[i],
+            'year': years[i]
+        } for i in pareto]
+
+    # Pareto winners in (sex, age) order: 'F' sorts before 'M' and each
+    # front is already ordered by age, so no sort is needed
+    pareto_winners = pareto_winners_by_sex['F'] + pareto_winners_by_sex['M']
+
+    return {
+        'male_all': all_data['M'],
+        'female_all': all_data['F'],
+        'male_pareto': pareto_data['M'],
+        'female_pareto': pareto_data['F'],
+        'pareto_winners': pareto_winners
+    }
+
+
+def encode_json(data):
+    """Serialize a payload once, returning the response body and its ETag"""
+    body = f"{app.json.dumps(data, separators=(',', ':'))}\n".encode('utf-8')
+    return body, hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+@lru_cache(maxsize=32)
+def race_data_json(year, version):
+    """Serialized race data for a year"""
+    return encode_json(build_race_data(year))
+
+
+@lru_cache(maxsize=1)
+def all_time_data_json(version):
+    """Serialized all-time data"""
+    return encode_json(build_all_time_data())
+
+
+def load_race_json(year):
+    """Serialized race data for a year, cached until a results file changes"""
+    return race_data_json(year, data_version(YEARS))
+
+
+def load_all_time_json():
+    """Serialized all-time data, cached until a results file changes"""
+    return all_time_data_json(data_version(YEARS))
+
+
+def json_response(body, etag):
+    """Serve cached JSON bytes, answering 304 when the client already has them"""
+    response = Response(body, mimetype=app.json.mimetype)
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = DATA_MAX_AGE
+    return response.make_conditional(request)
+
+
+def warmup():
+    """Build and serialize every view up front so the first requests are served from cache"""
+    for year in YEARS:
+        load_race_json(year)
+    load_all_time_json()
+
+
+warmup()
+
+
+def send_page(filename):
+    """Serve a chart page from the app directory, with ETag/304 handling and a max-age"""
+    return send_from_directory(app.root_path, filename, max_age=PAGE_MAX_AGE)
+
+
 @app.route('/')
 def index():
-    return send_file('race_chart_2025.html')
+    return send_page('race_chart_2025.html')
 
 
 @app.route('/2025')
 def index_2025():
-    return send_file('race_chart_2025.html')
+    return send_page('race_chart_2025.html')
 
 
 @app.route('/2023')
 def index_2023():
-    return send_file('race_chart_2023.html')
+    return send_page('race_chart_2023.html')
 
 
 @app.route('/2024')
 def index_2024():
-    return send_file('race_chart_2024.html')
+    return send_page('race_chart_2024.html')
 
 
 @app.route('/all-time')
 def index_all_time():
-    return send_file('race_chart_all_time.html')
+    return send_page('race_chart_all_time.html')
 
 
 @app.route('/data')
 def get_data():
     year = request.args.get('year', '2025')
-    return jsonify(load_race_data(year))
+    if year not in YEARS:
+        abort(404)
+    return json_response(*load_race_json(year))
 
 
 @app.route('/data/all-time')
 def get_all_time_data():
-    """Load all years combined for all-time view"""
-    all_years = ['2023', '2024', '2025']
-
-    # Load all results from all years
-    all_results = []
-    for year in all_years:
-        year_results = load_raw_results(year)
-        all_results.extend(year_results)
-
-    # Detect duplicate names and add year suffix if needed
-    name_year_counts = {}
-    for result in all_results:
-        name = result['name']
-        if name not in name_year_counts:
-            name_year_counts[name] = []
-        name_year_counts[name].append(result['year'])
-
-    # Add year to display name if person appears in multiple years
-    for result in all_results:
-        name = result['name']
-        if len(set(name_year_counts[name])) > 1:
-            result['display_name'] = f"{name} ({result['year']})"
-        else:
-            result['display_name'] = name
-
-    # Separate by sex
-    male_results = [r for r in all_results if r['sex'] == 'M']
-    female_results = [r for r in all_results if r['sex'] == 'F']
-
-    # For all-time, get fastest at each age then compute Pareto
-    def get_fastest_at_each_age(runners):
-        if not runners:
-            return []
-        age_groups = {}
-        for runner in runners:
-            age = runner['age']
-            if age not in age_groups or runner['time_seconds'] < age_groups[age]['time_seconds']:
-                age_groups[age] = runner
-        return list(age_groups.values())
-
-    def compute_pareto_front(runners):
-        if not runners:
-            return []
-        fastest = min(runners, key=lambda x: x['time_seconds'])
-        peak_age = fastest['age']
-        sorted_runners = sorted(runners, key=lambda x: x['age'])
-        younger_than_peak = [r for r in sorted_runners if r['age'] < peak_age]
-        at_or_older_than_peak = [r for r in sorted_runners if r['age'] >= peak_age]
-        pareto = []
-        best_time_so_far = float('inf')
-        for runner in younger_than_peak:
-            if runner['time_seconds'] < best_time_so_far:
-                pareto.append(runner)
-                best_time_so_far = runner['time_seconds']
-        best_time_so_far = float('inf')
-        older_pareto = []
-        for runner in reversed(at_or_older_than_peak):
-            if runner['time_seconds'] < best_time_so_far:
-                older_pareto.append(runner)
-                best_time_so_far = runner['time_seconds']
-        pareto.extend(reversed(older_pareto))
-        return pareto
-
-    fastest_male_by_age = get_fastest_at_each_age(male_results)
-    fastest_female_by_age = get_fastest_at_each_age(female_results)
-    male_pareto = compute_pareto_front(fastest_male_by_age)
-    female_pareto = compute_pareto_front(fastest_female_by_age)
-
-    # Format data for display
-    male_data = [{
-        'age': r['age'],
-        'time_seconds': r['time_seconds'],
-        'time_display': r['time_display'],
-        'name': r['display_name'],
-        'year': r['year']
-    } for r in male_results]
-
-    female_data = [{
-        'age': r['age'],
-        'time_seconds': r['time_seconds'],
-        'time_display': r['time_display'],
-        'name': r['display_name'],
-        'year': r['year']
-    } for r in female_results]
-
-    male_pareto_data = [{
-        'age': r['age'],
-        'time_seconds': r['time_seconds'],
-        'time_display': r['time_display'],
-        'name': r['display_name'],
-        'year': r['year']
-    } for r in male_pareto]
-
-    female_pareto_data = [{
-        'age': r['age'],
-        'time_seconds': r['time_seconds'],
-        'time_display': r['time_display'],
-        'name': r['display_name'],
-        'year': r['year']
-    } for r in female_pareto]
-
-    # Create Pareto winners list (all runners on Pareto front)
-    pareto_winners = []
-    for r in male_pareto:
-        pareto_winners.append({
-            'name': r['display_name'],
-            'age': r['age'],
-            'sex': 'M',
-            'time_display': r['time_display'],
-            'year': r['year']
-        })
-    for r in female_pareto:
-        pareto_winners.append({
-            'name': r['display_name'],
-            'age': r['age'],
-            'sex': 'F',
-            'time_display': r['time_display'],
-            'year': r['year']
-        })
-
-    # Sort by sex then age
-    pareto_winners.sort(key=lambda x: (x['sex'], x['age']))
-
-    return jsonify({
-        'male_all': male_data,
-        'female_all': female_data,
-        'male_pareto': male_pareto_data,
-        'female_pareto': female_pareto_data,
-        'pareto_winners': pareto_winners
-    })
+    return json_response(*load_all_time_json())
 
 
 if __name__ == '__main__':
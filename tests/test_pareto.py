@@ -0,0 +1,26 @@
+"""Regression tests for the all-time Pareto front
+
+Run from the repository root with: python -m unittest discover tests
+"""
+import unittest
+
+import build
+import server
+
+
+class TiedPeakTest(unittest.TestCase):
+    """When several ages tie for the fastest time, the peak is the age that appears first"""
+
+    ages = [28, 21]
+    times = [1020.0, 1020.0]
+
+    def test_build_keeps_younger_runner(self):
+        self.assertEqual(build.compute_all_time_pareto_front(self.ages, self.times), [1, 0])
+
+    def test_server_keeps_younger_runner(self):
+        fastest_by_age = server.get_fastest_at_each_age(self.ages, self.times)
+        self.assertEqual(server.compute_pareto_front(self.ages, self.times, fastest_by_age), [1, 0])
+
+
+if __name__ == '__main__':
+    unittest.main()